@@ -75,69 +75,8 @@ def create_sample_workflow():
             "cachedResultName": "Sheet1",
             "cachedResultUrl": "https://docs.google.com/spreadsheets/d/193K6ZufOQgQcV-7P4D6jyS8ejNfxIv32yvT2bR5lT2k/edit#gid=0"
         },
-        columns={
-            "mappingMode": "defineBelow",
-            "value": {
-                "name": "={{ $json.name }}",
-                "username": "={{ $json.username }}",
-                "email": "={{ $json.email }}",
-                "phone": "={{ $json.phone }}",
-                "website": "={{ $json.website }}"
-            },
-            "matchingColumns": [
-                "email"
-            ],
-            "schema": [
-                {
-                    "id": "name",
-                    "displayName": "name",
-                    "required": False,
-                    "defaultMatch": False,
-                    "display": True,
-                    "type": "string",
-                    "canBeUsedToMatch": True
-                },
-                {
-                    "id": "username",
-                    "displayName": "username",
-                    "required": False,
-                    "defaultMatch": False,
-                    "display": True,
-                    "type": "string",
-                    "canBeUsedToMatch": True
-                },
-                {
-                    "id": "email",
-                    "displayName": "email",
-                    "required": False,
-                    "defaultMatch": False,
-                    "display": True,
-                    "type": "string",
-                    "canBeUsedToMatch": True,
-                    "removed": False
-                },
-                {
-                    "id": "phone",
-                    "displayName": "phone",
-                    "required": False,
-                    "defaultMatch": False,
-                    "display": True,
-                    "type": "string",
-                    "canBeUsedToMatch": True
-                },
-                {
-                    "id": "website",
-                    "displayName": "website",
-                    "required": False,
-                    "defaultMatch": False,
-                    "display": True,
-                    "type": "string",
-                    "canBeUsedToMatch": True
-                }
-            ],
-            "attemptToConvertTypes": False,
-            "convertFieldsToString": False
-        },
+        columns=["name", "username", "email", "phone", "website"],
+        matching_columns=["email"],
         credential_id="Heyjvh3DnLP9bR1B",
         credential_name="Google Sheets account 3",
         position=[240, -16]
@@ -24,14 +24,20 @@ Example:
 For more information and detailed usage examples, see the documentation.
 """
 
-# Import core classes
-from .workflow import Workflow
-from .node import Node
+import importlib
 
-# Import specialized node classes
-from .nodes.manual_trigger import ManualTriggerNode
-from .nodes.http_request import HTTPRequestNode
-from .nodes.google_sheets import GoogleSheetsNode
+# Core and specialized node classes are imported lazily on first access (PEP 562),
+# so importing a single class does not load every node module
+_LAZY_IMPORTS = {
+    # Core classes
+    "Workflow": "n8n_python_sdk.workflow",
+    "Node": "n8n_python_sdk.node",
+    
+    # Specialized node classes
+    "ManualTriggerNode": "n8n_python_sdk.nodes.manual_trigger",
+    "HTTPRequestNode": "n8n_python_sdk.nodes.http_request",
+    "GoogleSheetsNode": "n8n_python_sdk.nodes.google_sheets",
+}
 
 # Import utility classes
 from .exceptions import (
@@ -88,4 +94,18 @@ __all__ = [
     
     # Version info
     "__version__",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    """Resolve lazily imported classes and cache them on the package."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
@@ -152,6 +152,29 @@ class ErrorCodes:
     IMPORT_INVALID_JSON = "IM002"
     IMPORT_MISSING_FIELDS = "IM003"
     IMPORT_UNSUPPORTED_VERSION = "IM004"
+    
+    # Codes grouped by category for O(1) membership checks,
+    # e.g. ``error.code in ErrorCodes.CONNECTION_CODES``
+    WORKFLOW_CODES = frozenset({
+        WORKFLOW_INVALID_NAME, WORKFLOW_NO_NODES,
+        WORKFLOW_DUPLICATE_NODE, WORKFLOW_VALIDATION_FAILED
+    })
+    NODE_CODES = frozenset({
+        NODE_INVALID_TYPE, NODE_INVALID_PARAMETERS,
+        NODE_MISSING_REQUIRED_FIELD, NODE_VALIDATION_FAILED
+    })
+    CONNECTION_CODES = frozenset({
+        CONNECTION_SOURCE_NOT_FOUND, CONNECTION_TARGET_NOT_FOUND,
+        CONNECTION_INVALID_OUTPUT, CONNECTION_CIRCULAR_DEPENDENCY
+    })
+    EXPORT_CODES = frozenset({
+        EXPORT_FILE_ERROR, EXPORT_SERIALIZATION_ERROR, EXPORT_VALIDATION_ERROR
+    })
+    IMPORT_CODES = frozenset({
+        IMPORT_FILE_NOT_FOUND, IMPORT_INVALID_JSON,
+        IMPORT_MISSING_FIELDS, IMPORT_UNSUPPORTED_VERSION
+    })
+    ALL_CODES = WORKFLOW_CODES | NODE_CODES | CONNECTION_CODES | EXPORT_CODES | IMPORT_CODES
 
 
 def create_error(error_type: type, message: str, code: str = None) -> SDKError:
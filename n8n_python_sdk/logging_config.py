@@ -115,9 +115,10 @@ def configure_logging(
         sdk_logger.addHandler(file_handler)
     
     # Log the configuration
-    sdk_logger.info(f"Logging configured - Level: {logging.getLevelName(level)}, "
-                   f"Console: {type(console_handler).__name__}, "
-                   f"File: {'Enabled' if enable_file_logging else 'Disabled'}")
+    if sdk_logger.isEnabledFor(logging.INFO):
+        sdk_logger.info(f"Logging configured - Level: {logging.getLevelName(level)}, "
+                       f"Console: {type(console_handler).__name__}, "
+                       f"File: {'Enabled' if enable_file_logging else 'Disabled'}")
     
     return sdk_logger
 
@@ -188,19 +189,6 @@ def enable_debug_logging() -> None:
     set_log_level(logging.DEBUG)
 
 
-# Pre-configure basic logging when module is imported
-# This ensures there's always some logging available even if configure_logging isn't called
-_default_configured = False
-
-def _ensure_default_logging():
-    """Ensure basic logging is configured if configure_logging hasn't been called."""
-    global _default_configured
-    if not _default_configured:
-        # Only add handler if none exist
-        sdk_logger = logging.getLogger('n8n_sdk')
-        if not sdk_logger.handlers:
-            configure_logging(level=logging.WARNING)  # Default to WARNING level
-        _default_configured = True
-
-# Configure default logging on import
-_ensure_default_logging()
\ No newline at end of file
+# Library best practice: attach only a NullHandler on import and leave real
+# handler setup to configure_logging(), which users call explicitly
+logging.getLogger('n8n_sdk').addHandler(logging.NullHandler())
@@ -5,17 +5,47 @@ This module contains the base Node class and specialized node implementations.
 """
 
 from typing import Dict, Any, Optional, List, Tuple, Union
-import uuid
 import logging
-try:
-    from .exceptions import NodeError, ErrorCodes
-except ImportError:
-    from exceptions import NodeError, ErrorCodes
+import os
+import random
+from .exceptions import NodeError, ErrorCodes
+from .utils.json_io import dump_json_bytes
 
 # Configure logger for the node module
 logger = logging.getLogger('n8n_sdk.node')
 
 
+# Bit masks for formatting 128-bit random values as version 4 UUIDs:
+# version 4 in bits 76-79 and the RFC 4122 variant in bits 62-63 of the 128-bit value
+_UUID_CLEAR_BITS = ~((0xF000 << 64) | (0xC000 << 48))
+_UUID_SET_BITS = (0x4000 << 64) | (0x8000 << 48)
+
+
+# Private generator for IDs, seeded from os.urandom. Seeding or drawing from the
+# global ``random`` module does not affect it, and forked children reseed it so
+# they do not repeat their parent's IDs.
+_id_random = random.Random()
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_id_random.seed)
+
+
+def _fast_uuid() -> str:
+    """
+    Generate a random (version 4) UUID string.
+    
+    Same format as ``str(uuid.uuid4())``, but drawn from a private Mersenne
+    Twister generator instead of an ``os.urandom`` syscall per ID. Node and
+    workflow IDs only need to be unique, not unpredictable.
+    """
+    return _format_uuid(_id_random.getrandbits(128))
+
+
+def _format_uuid(value: int) -> str:
+    """Stamp version 4 / RFC 4122 variant bits onto a 128-bit random value and format it."""
+    h = f"{(value & _UUID_CLEAR_BITS) | _UUID_SET_BITS:032x}"
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 class Node:
     """
     Base class for all n8n nodes.
@@ -24,6 +54,13 @@ class Node:
     such as id, name, type, and position.
     """
     
+    # Fixed attribute layout: no per-instance __dict__. Subclasses declare
+    # their own (usually empty) __slots__ to keep the benefit.
+    __slots__ = (
+        '_id', '_hash', '_type', '_name', '_type_version',
+        '_parameters', '_position', '_credentials', '_dict_cache'
+    )
+    
     def __init__(
         self,
         node_type: str,
@@ -45,38 +82,166 @@ class Node:
             parameters: Node-specific parameters
             position: [x, y] coordinates for node position in workflow
             credentials: Credentials configuration for the node
+        
+        Note:
+            ``parameters``, ``position`` and ``credentials`` are stored by
+            reference, not copied. The node takes ownership of them, so do not
+            mutate them after passing them in.
         """
         if not node_type or not node_type.strip():
             raise NodeError("Node type cannot be empty", ErrorCodes.NODE_INVALID_TYPE)
+        
+        self._init_trusted(
+            node_type.strip(), name, node_id, type_version, parameters, position, credentials
+        )
+    
+    def _init_trusted(
+        self,
+        node_type: str,
+        name: str,
+        node_id: Optional[str] = None,
+        type_version: Union[int, float] = 1,
+        parameters: Optional[Dict[str, Any]] = None,
+        position: Optional[List[int]] = None,
+        credentials: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Initialize the node fields, trusting ``node_type`` as given.
+        
+        Internal fast path for specialized nodes, which pass their node type as
+        a known-good literal, so it is neither checked nor stripped. The name is
+        user-supplied and is still validated. Arguments are the same as for
+        ``__init__``.
+        """
         if not name or not name.strip():
             raise NodeError("Node name cannot be empty", ErrorCodes.NODE_MISSING_REQUIRED_FIELD)
         
-        self.id = node_id if node_id else str(uuid.uuid4())
-        self.type = node_type.strip()
+        # Cached to_dict() base fields, reset whenever one of them is reassigned
+        self._dict_cache: Optional[Dict[str, Any]] = None
+        
+        self.id = node_id if node_id else _fast_uuid()
+        self.type = node_type
         self.name = name.strip()
         self.type_version = type_version
         self.parameters = parameters or {}
         self.position = position or [0, 0]
         self.credentials = credentials or {}
         
-        logger.debug(f"Created node '{self.name}' (ID: {self.id}, Type: {self.type})")
+        logger.debug("Created node '%s' (ID: %s, Type: %s)", self._name, self._id, self._type)
+    
+    @property
+    def id(self) -> str:
+        """Unique identifier of the node."""
+        return self._id
+    
+    @id.setter
+    def id(self, value: str) -> None:
+        self._id = value
+        self._hash = hash(value)
+        self._dict_cache = None
+    
+    @property
+    def type(self) -> str:
+        """The n8n node type (e.g., 'n8n-nodes-base.httpRequest')."""
+        return self._type
+    
+    @type.setter
+    def type(self, value: str) -> None:
+        self._type = value
+        self._dict_cache = None
+    
+    @property
+    def name(self) -> str:
+        """Display name of the node."""
+        return self._name
+    
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._dict_cache = None
+    
+    @property
+    def type_version(self) -> Union[int, float]:
+        """Version of the node type."""
+        return self._type_version
+    
+    @type_version.setter
+    def type_version(self, value: Union[int, float]) -> None:
+        self._type_version = value
+        self._dict_cache = None
+    
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """Node-specific parameters."""
+        return self._parameters
+    
+    @parameters.setter
+    def parameters(self, value: Dict[str, Any]) -> None:
+        self._parameters = value
+        self._dict_cache = None
+    
+    @property
+    def position(self) -> List[int]:
+        """[x, y] coordinates of the node in the workflow."""
+        return self._position
+    
+    @position.setter
+    def position(self, value: List[int]) -> None:
+        self._position = value
+        self._dict_cache = None
+    
+    @property
+    def credentials(self) -> Dict[str, Any]:
+        """Credentials configuration for the node."""
+        return self._credentials
+    
+    @credentials.setter
+    def credentials(self, value: Dict[str, Any]) -> None:
+        self._credentials = value
         
     def to_dict(self) -> Dict[str, Any]:
-        """Convert node to n8n-compatible dictionary format."""
-        node_dict = {
-            "id": self.id,
-            "name": self.name,
-            "type": self.type,
-            "typeVersion": self.type_version,
-            "position": list(self.position),  # Convert to list for JSON serialization
-            "parameters": self.parameters
-        }
-        
-        # Only include credentials if they exist
+        """
+        Convert node to n8n-compatible dictionary format.
+        
+        The base fields are cached on the node and rebuilt only after one of
+        them is reassigned; each call returns a new shallow copy of that cache.
+        The ``position`` and ``parameters`` values are shared with the node
+        rather than copied.
+        """
+        base = self._dict_cache
+        if base is None:
+            base = self._dict_cache = {
+                "id": self.id,
+                "name": self.name,
+                "type": self.type,
+                "typeVersion": self.type_version,
+                "position": self.position,
+                "parameters": self.parameters
+            }
+        
+        node_dict = base.copy()
+        
+        # Only include credentials if they exist (checked on every call, since
+        # they may have been filled in place since the cache was built)
         if self.credentials:
             node_dict["credentials"] = self.credentials
-            
+        
         return node_dict
+    
+    def to_json_bytes(self, pretty: bool = False) -> bytes:
+        """
+        Serialize the node to UTF-8 encoded JSON.
+        
+        Uses orjson when it is installed and the stdlib ``json`` module
+        otherwise; both produce the same output.
+        
+        Args:
+            pretty: Whether to indent the JSON by two spaces
+            
+        Returns:
+            The JSON document for ``to_dict()``
+        """
+        return dump_json_bytes(self.to_dict(), pretty)
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Node':
@@ -108,25 +273,21 @@ class Node:
         if not self.type:
             errors.append("Node type is required")
         
-        # Validate position format
-        if not isinstance(self.position, list) or len(self.position) != 2:
+        # Validate position format (plain type checks, no exception handling on the happy path)
+        position = self.position
+        if not isinstance(position, list) or len(position) != 2:
             errors.append("Position must be a list of 2 numbers")
-        else:
-            try:
-                float(self.position[0])
-                float(self.position[1])
-            except (TypeError, ValueError):
-                errors.append("Position coordinates must be numeric")
+        elif not all(isinstance(coordinate, (int, float)) for coordinate in position):
+            errors.append("Position coordinates must be numeric")
         
         # Validate type version
         if not isinstance(self.type_version, (int, float)):
             errors.append("Type version must be numeric")
         
         # Validate parameters and credentials are dictionaries
-        if not isinstance(self.parameters, dict):
-            errors.append("Parameters must be a dictionary")
-        if not isinstance(self.credentials, dict):
-            errors.append("Credentials must be a dictionary")
+        for field_name, value in (("Parameters", self.parameters), ("Credentials", self.credentials)):
+            if not isinstance(value, dict):
+                errors.append(f"{field_name} must be a dictionary")
             
         return errors
     
@@ -149,5 +310,5 @@ class Node:
         return self.id == other.id
     
     def __hash__(self) -> int:
-        """Make Node hashable based on id."""
-        return hash(self.id)
\ No newline at end of file
+        """Make Node hashable based on id (precomputed when the id is set)."""
+        return self._hash
\ No newline at end of file
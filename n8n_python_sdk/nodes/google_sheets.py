@@ -4,11 +4,74 @@ n8n Python SDK - Google Sheets Node
 This module contains the GoogleSheetsNode class for n8n Google Sheets nodes.
 """
 
-from typing import Dict, Any, Optional, List, Union
-try:
-    from ..node import Node
-except ImportError:
-    from node import Node
+from typing import Dict, Any, Optional, List, Sequence, Union
+from ..node import Node
+
+
+# Schema fields shared by every column generated from a list of column names
+_DEFAULT_COLUMN_SCHEMA_ENTRY = {
+    "required": False,
+    "defaultMatch": False,
+    "display": True,
+    "type": "string",
+    "canBeUsedToMatch": True
+}
+
+
+def _build_columns_schema(names: Sequence[str], match: Sequence[str]) -> Dict[str, Any]:
+    """
+    Build a 'defineBelow' columns configuration from column names.
+    
+    Each column is mapped to the input field of the same name. A new
+    configuration is built on every call, so nodes never share it. Matching
+    columns get ``"removed": False`` in their schema entry, as in workflows
+    exported from the n8n editor (see the sample workflow001.json), so a
+    generated schema matches such an export field for field.
+    
+    Args:
+        names: Column names, in sheet order
+        match: Column names used to match existing rows
+        
+    Returns:
+        Columns configuration dictionary for the Google Sheets node
+    """
+    return {
+        "mappingMode": "defineBelow",
+        "value": {name: f"={{{{ $json.{name} }}}}" for name in names},
+        "matchingColumns": list(match),
+        "schema": [
+            {
+                "id": name,
+                "displayName": name,
+                **_DEFAULT_COLUMN_SCHEMA_ENTRY,
+                **({"removed": False} if name in match else {})
+            }
+            for name in names
+        ],
+        "attemptToConvertTypes": False,
+        "convertFieldsToString": False
+    }
+
+
+def _rl_doc(document_id: str) -> Dict[str, Any]:
+    """Wrap a plain document ID in a resource locator object."""
+    return {"__rl": True, "value": document_id, "mode": "list"}
+
+
+def _rl_sheet(sheet_name: str) -> Dict[str, Any]:
+    """Wrap a plain sheet name in a resource locator object for the first sheet."""
+    return {"__rl": True, "value": "gid=0", "mode": "list", "cachedResultName": sheet_name}
+
+
+def _as_is(value: Any) -> Any:
+    """Pass an already-built resource locator object through unchanged."""
+    return value
+
+
+# Resource locator builders keyed by the exact type of the user value;
+# anything else (normally a ready-made dict) is used as given
+_DOC_ID_BUILDERS = {str: _rl_doc}
+_SHEET_NAME_BUILDERS = {str: _rl_sheet}
 
 
 class GoogleSheetsNode(Node):
@@ -19,6 +82,8 @@ class GoogleSheetsNode(Node):
     as part of a workflow.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         name: str = "Google Sheets",
@@ -54,26 +119,11 @@ class GoogleSheetsNode(Node):
         
         # Add document ID
         if document_id is not None:
-            if isinstance(document_id, str):
-                parameters["documentId"] = {
-                    "__rl": True,
-                    "value": document_id,
-                    "mode": "list"
-                }
-            else:
-                parameters["documentId"] = document_id
+            parameters["documentId"] = _DOC_ID_BUILDERS.get(type(document_id), _as_is)(document_id)
                 
         # Add sheet name
         if sheet_name is not None:
-            if isinstance(sheet_name, str):
-                parameters["sheetName"] = {
-                    "__rl": True,
-                    "value": "gid=0",  # Default to first sheet
-                    "mode": "list",
-                    "cachedResultName": sheet_name
-                }
-            else:
-                parameters["sheetName"] = sheet_name
+            parameters["sheetName"] = _SHEET_NAME_BUILDERS.get(type(sheet_name), _as_is)(sheet_name)
                 
         # Add columns configuration
         if columns is not None:
@@ -87,14 +137,14 @@ class GoogleSheetsNode(Node):
                 "name": credential_name
             }
             
-        super().__init__(
+        self._init_trusted(
             node_type="n8n-nodes-base.googleSheets",
             name=name,
             node_id=node_id,
             type_version=4.7,
             parameters=parameters,
             credentials=credentials,
-            position=position or [0, 0]
+            position=position
         )
         
     @classmethod
@@ -103,7 +153,7 @@ class GoogleSheetsNode(Node):
         name: str = "Append or update row in sheet",
         document_id: Optional[Union[str, Dict[str, Any]]] = None,
         sheet_name: Optional[Union[str, Dict[str, Any]]] = None,
-        columns: Optional[Dict[str, Any]] = None,
+        columns: Optional[Union[Dict[str, Any], List[str]]] = None,
         matching_columns: Optional[List[str]] = None,
         credential_id: Optional[str] = None,
         credential_name: Optional[str] = None,
@@ -117,15 +167,27 @@ class GoogleSheetsNode(Node):
             name: The display name for the node
             document_id: Google Sheets document ID or resource locator object
             sheet_name: Sheet name or resource locator object
-            columns: Column mappings for the operation
+            columns: Column mappings for the operation, or a non-empty list of
+                column names to map each column to the input field of the
+                same name (an empty list is treated like None)
             matching_columns: Columns to use for matching existing rows
             credential_id: ID of the Google Sheets OAuth2 credential
             credential_name: Name of the Google Sheets OAuth2 credential
             node_id: Unique identifier for the node (auto-generated if None)
             position: [x, y] coordinates for node position in workflow
+        
+        Note:
+            Dictionaries passed as ``document_id``, ``sheet_name`` and
+            ``columns`` are used as-is rather than deep-copied; a ``columns``
+            dict is completed in place with the default mapping mode and
+            matching columns. Do not share them between nodes or mutate them
+            afterwards.
         """
         # Set up columns configuration
-        columns_config = columns or {}
+        if isinstance(columns, (list, tuple)) and columns:
+            columns_config = _build_columns_schema(columns, matching_columns or ())
+        else:
+            columns_config = columns or {}
         if not isinstance(columns_config, dict):
             columns_config = {}
             
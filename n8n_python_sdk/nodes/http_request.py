@@ -5,10 +5,12 @@ This module contains the HTTPRequestNode class for n8n HTTP request nodes.
 """
 
 from typing import Dict, Any, Optional, List, Union
-try:
-    from ..node import Node
-except ImportError:
-    from node import Node
+from ..node import Node
+
+
+def _kv_params(pairs: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """Convert a mapping to n8n's ``{"parameters": [{"name", "value"}]}`` shape."""
+    return {"parameters": [{"name": key, "value": value} for key, value in pairs.items()]}
 
 
 class HTTPRequestNode(Node):
@@ -19,6 +21,8 @@ class HTTPRequestNode(Node):
     and services as part of a workflow.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         name: str = "HTTP Request",
@@ -66,21 +70,11 @@ class HTTPRequestNode(Node):
             
         # Add headers if provided
         if headers:
-            parameters["headers"] = {
-                "parameters": [
-                    {"name": key, "value": value} 
-                    for key, value in headers.items()
-                ]
-            }
+            parameters["headers"] = _kv_params(headers)
             
         # Add query parameters if provided
         if query_parameters:
-            parameters["qs"] = {
-                "parameters": [
-                    {"name": key, "value": value}
-                    for key, value in query_parameters.items()
-                ]
-            }
+            parameters["qs"] = _kv_params(query_parameters)
             
         # Add body if provided
         if body is not None:
@@ -94,12 +88,10 @@ class HTTPRequestNode(Node):
             elif body_content_type == "form":
                 parameters["sendBody"] = True
                 parameters["bodyContentType"] = "form-urlencoded"
-                parameters["bodyParameters"] = {
-                    "parameters": [
-                        {"name": key, "value": value}
-                        for key, value in body.items()
-                    ] if isinstance(body, dict) else []
-                }
+                # Empty or non-dict bodies still emit an empty parameter list
+                parameters["bodyParameters"] = (
+                    _kv_params(body) if body and isinstance(body, dict) else {"parameters": []}
+                )
             else:
                 parameters["sendBody"] = True
                 parameters["bodyContentType"] = body_content_type
@@ -109,13 +101,13 @@ class HTTPRequestNode(Node):
         if response_format != "json":
             parameters["responseFormat"] = response_format
             
-        super().__init__(
+        self._init_trusted(
             node_type="n8n-nodes-base.httpRequest",
             name=name,
             node_id=node_id,
             type_version=4.2,
             parameters=parameters,
-            position=position or [0, 0]
+            position=position
         )
         
     def to_dict(self) -> Dict[str, Any]:
@@ -5,10 +5,7 @@ This module contains the ManualTriggerNode class for n8n manual trigger nodes.
 """
 
 from typing import Dict, Any, Optional, List
-try:
-    from ..node import Node
-except ImportError:
-    from node import Node
+from ..node import Node
 
 
 class ManualTriggerNode(Node):
@@ -19,6 +16,8 @@ class ManualTriggerNode(Node):
     It's typically the first node in a workflow.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         name: str = "When clicking 'Execute workflow'",
@@ -33,13 +32,13 @@ class ManualTriggerNode(Node):
             node_id: Unique identifier for the node (auto-generated if None)
             position: [x, y] coordinates for node position in workflow
         """
-        super().__init__(
+        self._init_trusted(
             node_type="n8n-nodes-base.manualTrigger",
             name=name,
             node_id=node_id,
             type_version=1,
             parameters={},  # Manual trigger has empty parameters
-            position=position or [0, 0]
+            position=position
         )
         
     def to_dict(self) -> Dict[str, Any]:
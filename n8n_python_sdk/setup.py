@@ -36,6 +36,9 @@ setup(
             "isort>=5.0.0",
             "mypy>=1.0.0",
         ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
         "http": [
             "requests>=2.28.0",
         ],
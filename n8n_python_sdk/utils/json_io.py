@@ -0,0 +1,72 @@
+"""
+n8n Python SDK - JSON Encoding and Decoding
+
+This module holds the JSON backend shared by the SDK: orjson when it is
+installed and the stdlib ``json`` module otherwise. It imports nothing else
+from the SDK, so importing it stays cheap.
+"""
+
+import json
+import mmap
+from typing import Any, BinaryIO
+
+# orjson is an optional, much faster JSON backend; fall back to the stdlib if missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are memory-mapped for orjson instead of read into a buffer
+MMAP_THRESHOLD = 64 * 1024
+
+
+def dump_json_bytes(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize ``data`` to UTF-8 encoded JSON.
+
+    Both backends produce the same output: two-space indentation when
+    ``pretty`` is set, and no whitespace otherwise.
+
+    Args:
+        data: JSON-serializable data
+        pretty: Whether to indent the JSON by two spaces
+
+    Returns:
+        The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0))
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def load_json_file_object(file: BinaryIO, size: int) -> Any:
+    """
+    Parse JSON from a file opened in binary mode, with the fastest available backend.
+
+    With orjson installed, files of at least MMAP_THRESHOLD bytes are
+    memory-mapped and parsed without first copying them into a bytes object,
+    and smaller files are parsed from their raw bytes. Otherwise the stdlib
+    ``json`` module is used.
+
+    Args:
+        file: File object opened in binary mode, positioned at the start
+        size: Size of the file in bytes
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        json.JSONDecodeError: If the file contains invalid JSON (orjson's
+            decode error is a subclass of it)
+    """
+    if orjson is None:
+        return json.load(file)
+    if size >= MMAP_THRESHOLD:
+        # Parse straight from the page cache; the view is released before the mapping closes
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+    # orjson parses the raw UTF-8 bytes without a str decode step
+    return orjson.loads(file.read())
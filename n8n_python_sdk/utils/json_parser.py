@@ -4,9 +4,30 @@ n8n Python SDK - JSON Parser Utilities
 This module contains utilities for parsing and validating n8n JSON workflow files.
 """
 
+import fnmatch
+import functools
 import json
-from typing import Dict, Any, Optional, List
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Any, Iterator, Optional, List, Tuple
+
+from .json_io import load_json_file_object
+
+# Keys every node in a workflow file must have (tuple keeps error messages in a stable order)
+_REQUIRED_NODE_KEY_ORDER = ("id", "name", "type", "position")
+_REQUIRED_NODE_KEYS = frozenset(_REQUIRED_NODE_KEY_ORDER)
+
+# Type rules for node fields as (key, check, error message suffix), in reporting order.
+# Only consulted to build the error message once the combined fast check has failed.
+_NODE_FIELD_RULES = (
+    ("id", lambda value: isinstance(value, str), "id must be a string"),
+    ("name", lambda value: isinstance(value, str), "name must be a string"),
+    ("type", lambda value: isinstance(value, str), "type must be a string"),
+    ("position", lambda value: isinstance(value, list) and len(value) == 2,
+     "position must be a list of 2 numbers"),
+)
 
 
 def validate_file_path(file_path: str) -> bool:
@@ -27,15 +48,16 @@ def validate_file_path(file_path: str) -> bool:
     if not file_path:
         raise ValueError("File path cannot be empty or None")
     
-    path = Path(file_path)
-    
-    if not path.exists():
+    # A single stat() call answers both "exists" and "is a regular file"
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    if not path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValueError(f"Path is not a file: {file_path}")
     
-    if path.suffix.lower() != '.json':
+    if not os.fspath(file_path).lower().endswith('.json'):
         raise ValueError(f"File must have .json extension: {file_path}")
     
     return True
@@ -53,20 +75,22 @@ def read_json_file(file_path: str) -> Dict[str, Any]:
         
     Raises:
         FileNotFoundError: If file cannot be found or opened
+        ValueError: If the file is empty
         json.JSONDecodeError: If file contains invalid JSON
         IOError: If there's an error reading the file
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-            
-        if not content.strip():
-            raise ValueError(f"JSON file is empty: {file_path}")
-            
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {str(e)}", e.doc, e.pos)
+        with open(file_path, 'rb') as file:
+            # An O(1) size check replaces reading and stripping the whole content
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                raise ValueError(f"JSON file is empty: {file_path}")
+                
+            try:
+                data = load_json_file_object(file, size)
+            except json.JSONDecodeError as e:
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both backends land here
+                raise json.JSONDecodeError(f"Invalid JSON in file {file_path}: {str(e)}", e.doc, e.pos)
             
         return data
         
@@ -106,39 +130,42 @@ def validate_workflow_structure(data: Dict[str, Any]) -> bool:
     if len(nodes) == 0:
         raise ValueError("Workflow must contain at least one node")
     
-    # Validate each node
+    # Validate each node, collecting node names for connection validation in the same pass
+    node_names = set()
     for i, node in enumerate(nodes):
         if not isinstance(node, dict):
             raise ValueError(f"Node {i} must be a dictionary")
         
-        required_node_keys = ["id", "name", "type", "position"]
-        missing_node_keys = [key for key in required_node_keys if key not in node]
+        missing_node_keys = _REQUIRED_NODE_KEYS - node.keys()
         if missing_node_keys:
+            missing_node_keys = [key for key in _REQUIRED_NODE_KEY_ORDER if key in missing_node_keys]
             raise ValueError(f"Node {i} missing required keys: {missing_node_keys}")
         
-        # Validate node properties
-        if not isinstance(node["id"], str):
-            raise ValueError(f"Node {i} id must be a string")
-        if not isinstance(node["name"], str):
-            raise ValueError(f"Node {i} name must be a string")
-        if not isinstance(node["type"], str):
-            raise ValueError(f"Node {i} type must be a string")
-        if not isinstance(node["position"], list) or len(node["position"]) != 2:
-            raise ValueError(f"Node {i} position must be a list of 2 numbers")
+        # Validate node properties: one combined check for the common valid case,
+        # falling back to the rule table to report the first failing field
+        name = node["name"]
+        position = node["position"]
+        if not (isinstance(node["id"], str) and isinstance(name, str) and isinstance(node["type"], str)
+                and isinstance(position, list) and len(position) == 2):
+            for key, check, message in _NODE_FIELD_RULES:
+                if not check(node[key]):
+                    raise ValueError(f"Node {i} {message}")
+        
+        node_names.add(name)
     
     # Validate connections structure
     connections = data["connections"]
     if not isinstance(connections, dict):
         raise ValueError("Connections must be a dictionary")
     
-    # Get all node names for connection validation
-    node_names = {node["name"] for node in nodes}
+    # Every connection source must be a node; one set difference checks them all
+    missing_sources = connections.keys() - node_names
+    if missing_sources:
+        raise ValueError(_missing_nodes_message("source", connections, missing_sources))
     
-    # Validate connection structure
+    # Validate connection structure, collecting target names for a single check afterwards
+    targets = set()
     for source_node, connection_data in connections.items():
-        if source_node not in node_names:
-            raise ValueError(f"Connection source node '{source_node}' not found in workflow nodes")
-        
         if not isinstance(connection_data, dict):
             raise ValueError(f"Connection data for '{source_node}' must be a dictionary")
         
@@ -156,12 +183,33 @@ def validate_workflow_structure(data: Dict[str, Any]) -> bool:
                         raise ValueError(f"Connection must be a dictionary")
                     if "node" not in conn:
                         raise ValueError(f"Connection missing 'node' key")
-                    if conn["node"] not in node_names:
-                        raise ValueError(f"Connection target node '{conn['node']}' not found in workflow nodes")
+                    targets.add(conn["node"])
+    
+    missing_targets = targets - node_names
+    if missing_targets:
+        raise ValueError(_missing_nodes_message("target", sorted(missing_targets, key=str), missing_targets))
     
     return True
 
 
+def _missing_nodes_message(role: str, ordered_names, missing: set) -> str:
+    """
+    Build the error message for connection source or target names that are not nodes.
+    
+    Args:
+        role: Either "source" or "target"
+        ordered_names: Names in the order they should be reported
+        missing: The names that were not found
+        
+    Returns:
+        Error message naming every missing node
+    """
+    names = [name for name in ordered_names if name in missing]
+    if len(names) == 1:
+        return f"Connection {role} node '{names[0]}' not found in workflow nodes"
+    return f"Connection {role} nodes {names} not found in workflow nodes"
+
+
 def read_node_json(file_path: str) -> Dict[str, Any]:
     """
     Main utility function to read and validate n8n workflow JSON files.
@@ -190,10 +238,70 @@ def read_node_json(file_path: str) -> Dict[str, Any]:
     return data
 
 
+@functools.lru_cache(maxsize=1024)
+def _cached_read(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Read and validate a workflow file, memoized on its modification time and size.
+    
+    ``mtime_ns`` and ``size`` are not used directly; they are part of the cache
+    key so that a file is parsed again only after it changes on disk.
+    """
+    return read_node_json(path)
+
+
+def _iter_matching_files(directory_path: str, pattern: str, recursive: bool) -> Iterator[Tuple[str, str, Optional[os.DirEntry]]]:
+    """
+    Yield (file name, file path, directory entry) for files matching ``pattern``.
+    
+    The non-recursive case uses os.scandir, whose entries carry cached file
+    type information and are reused for the stat() call. The recursive case
+    uses os.walk without following symlinked directories, and yields no entry.
+    Both match file names only, so patterns with directory parts (such as
+    ``sub/*.json`` or ``**/*.json``) go through pathlib's glob instead.
+    """
+    if '/' in pattern or os.sep in pattern or '**' in pattern:
+        dir_path = Path(directory_path)
+        for file_path in (dir_path.rglob(pattern) if recursive else dir_path.glob(pattern)):
+            if file_path.is_file():
+                yield file_path.name, str(file_path), None
+    elif recursive:
+        for root, _dirs, files in os.walk(directory_path, followlinks=False):
+            for name in fnmatch.filter(files, pattern):
+                yield name, os.path.join(root, name), None
+    else:
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                if fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                    yield entry.name, entry.path, entry
+
+
+def _read_workflow_file(
+    file_path: str,
+    entry: Optional[os.DirEntry] = None
+) -> Tuple[Optional[Dict[str, Any]], Optional[Exception]]:
+    """
+    Read one workflow file for process_workflow_directory.
+    
+    Errors are returned rather than raised so that one bad file does not
+    abort the rest of the batch.
+    
+    Returns:
+        Tuple of (workflow data, None) on success or (None, exception) on failure
+    """
+    try:
+        # Reuse the cached result if the file is unchanged
+        st = entry.stat() if entry is not None else os.stat(file_path)
+        return _cached_read(os.path.realpath(file_path), st.st_mtime_ns, st.st_size), None
+    except Exception as e:
+        return None, e
+
+
 def process_workflow_directory(
     directory_path: str, 
     pattern: str = "*.json", 
-    recursive: bool = False
+    recursive: bool = False,
+    max_workers: Optional[int] = None,
+    errors: Optional[Dict[str, Exception]] = None
 ) -> Dict[str, Dict[str, Any]]:
     """
     Process multiple workflow files from a directory.
@@ -202,39 +310,52 @@ def process_workflow_directory(
         directory_path: Path to directory containing workflow JSON files
         pattern: File pattern to match (default: "*.json")
         recursive: Whether to search subdirectories recursively
+        max_workers: Number of threads used to read files in parallel
+                     (default: min(32, 4 * CPU count))
+        errors: Optional dictionary that receives the exception for each
+                file that could not be processed, keyed by filename. Without
+                it, a warning is printed for each such file.
         
     Returns:
-        Dictionary mapping filenames to their validated workflow data
+        Dictionary mapping filenames to their validated workflow data.
+        Parsed files are cached by (path, modification time, size), so
+        unchanged files are not parsed again on later calls and the same
+        dictionaries are returned; copy them before modifying.
         
     Raises:
         FileNotFoundError: If directory does not exist
         ValueError: If directory_path is not a directory
     """
-    dir_path = Path(directory_path)
-    
-    if not dir_path.exists():
+    try:
+        st = os.stat(directory_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise FileNotFoundError(f"Directory not found: {directory_path}")
     
-    if not dir_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         raise ValueError(f"Path is not a directory: {directory_path}")
     
     workflows = {}
     
-    # Use glob to find files matching the pattern
-    if recursive:
-        json_files = dir_path.rglob(pattern)
-    else:
-        json_files = dir_path.glob(pattern)
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
     
-    for file_path in json_files:
-        try:
-            # Try to parse each file
-            workflow_data = read_node_json(str(file_path))
-            workflows[file_path.name] = workflow_data
-            
-        except Exception as e:
-            # Log errors but continue processing other files
-            print(f"Warning: Failed to process {file_path.name}: {str(e)}")
-            continue
+    # Read and parse files in parallel; results are collected in submission
+    # order so the returned mapping does not depend on thread timing
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            (file_name, executor.submit(_read_workflow_file, file_path, entry))
+            for file_name, file_path, entry in _iter_matching_files(directory_path, pattern, recursive)
+        ]
+        
+        for file_name, future in futures:
+            workflow_data, error = future.result()
+            if error is not None:
+                # Report errors but continue processing other files
+                if errors is not None:
+                    errors[file_name] = error
+                else:
+                    print(f"Warning: Failed to process {file_name}: {str(error)}")
+                continue
+            workflows[file_name] = workflow_data
     
     return workflows
\ No newline at end of file
@@ -4,22 +4,55 @@ n8n Python SDK - Workflow Module
 This module contains the Workflow class for creating and managing n8n workflows.
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple, Union
+from collections import deque
 import json
-import uuid
 import os
 import logging
 from datetime import datetime
-try:
-    from .node import Node
-    from .exceptions import WorkflowError, ValidationError, ExportError, ErrorCodes
-except ImportError:
-    from node import Node
-    from exceptions import WorkflowError, ValidationError, ExportError, ErrorCodes
+from .node import Node, _fast_uuid
+from .utils.json_io import dump_json_bytes, load_json_file_object
+from .exceptions import WorkflowError, ValidationError, ExportError, ErrorCodes
 
 # Configure logger for the workflow module
 logger = logging.getLogger('n8n_sdk.workflow')
 
+# Buffer size used when writing exported workflow files (1 MiB)
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Workflows with more nodes than this are exported node by node instead of as one payload
+STREAMING_EXPORT_THRESHOLD = 10000
+
+
+def _iter_json_chunks(data: Dict[str, Any], pretty: bool) -> Iterator[bytes]:
+    """
+    Encode a workflow dictionary as JSON in pieces, one per node.
+    
+    The concatenated chunks are byte-for-byte equal to
+    ``dump_json_bytes(data, pretty)``, but only one node is encoded at a
+    time, so the whole document never has to exist as a single bytes object.
+    Pretty output is re-indented by inserting spaces after each newline,
+    which is safe because JSON strings cannot contain raw newlines.
+    """
+    member_indent = b'\n  ' if pretty else b''
+    item_indent = b'\n    ' if pretty else b''
+    key_separator = b': ' if pretty else b':'
+    
+    yield b'{'
+    for position, (key, value) in enumerate(data.items()):
+        yield (b',' if position else b'') + member_indent + dump_json_bytes(key) + key_separator
+        if key == "nodes" and value:
+            for index, node_dict in enumerate(value):
+                chunk = dump_json_bytes(node_dict, pretty)
+                if pretty:
+                    chunk = chunk.replace(b'\n', item_indent)
+                yield (b',' if index else b'[') + item_indent + chunk
+            yield member_indent + b']'
+        else:
+            chunk = dump_json_bytes(value, pretty)
+            yield chunk.replace(b'\n', member_indent) if pretty else chunk
+    yield b'\n}' if pretty and data else b'}'
+
 
 class Workflow:
     """
@@ -29,6 +62,12 @@ class Workflow:
     and can be exported to n8n-compatible JSON format.
     """
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        'id', 'name', 'nodes', '_nodes_by_id', '_nodes_by_name',
+        'connections', 'active', 'settings', 'tags', 'created_at', '_updated_at', '_dirty'
+    )
+    
     def __init__(self, name: str = "New Workflow", workflow_id: Optional[str] = None):
         """
         Initialize a new workflow.
@@ -40,17 +79,57 @@ class Workflow:
         if not name or not name.strip():
             raise WorkflowError("Workflow name cannot be empty", ErrorCodes.WORKFLOW_INVALID_NAME)
         
-        self.id = workflow_id if workflow_id else str(uuid.uuid4())
+        self.id = workflow_id if workflow_id else _fast_uuid()
         self.name = name.strip()
         self.nodes: List[Node] = []
-        self.connections: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        # Index of self.nodes by node ID for O(1) duplicate checks and lookups
+        self._nodes_by_id: Dict[str, Node] = {}
+        # Index of self.nodes by node name (first node added under each name), as the
+        # names were when the nodes were added; duplicate names are allowed with a warning
+        self._nodes_by_name: Dict[str, Node] = {}
+        # Connections are stored directly in n8n's export shape, keyed by source node name:
+        # {source_name: {output_type: [[{"node": target_name, "type": input_type, "index": i}]]}}
+        # so to_dict() and validate() use them as-is without any conversion
+        self.connections: Dict[str, Dict[str, List[List[Dict[str, Any]]]]] = {}
         self.active = True
         self.settings: Dict[str, Any] = {}
         self.tags: List[str] = []
         self.created_at = datetime.now().isoformat()
-        self.updated_at = self.created_at
+        self._updated_at = self.created_at
+        # Set by mutations; the updated_at timestamp is only formatted when next read
+        self._dirty = False
         
-        logger.info(f"Created new workflow: '{self.name}' (ID: {self.id})")
+        logger.info("Created new workflow: '%s' (ID: %s)", self.name, self.id)
+        
+    def _iter_connection_targets(self) -> Iterator[Tuple[str, List[Any]]]:
+        """Yield (source name, target names) for every source in the connections."""
+        for source_name, outputs in self.connections.items():
+            yield source_name, [
+                connection['node']
+                for output_groups in outputs.values()
+                for output_group in output_groups
+                for connection in output_group
+                if isinstance(connection, dict) and 'node' in connection
+            ]
+    
+    @property
+    def updated_at(self) -> str:
+        """
+        ISO timestamp of the last change to the workflow.
+        
+        Adding nodes and connections only marks the workflow as changed; the
+        timestamp is taken when this property is next read, so a batch of
+        changes costs a single clock read.
+        """
+        if self._dirty:
+            self._updated_at = datetime.now().isoformat()
+            self._dirty = False
+        return self._updated_at
+    
+    @updated_at.setter
+    def updated_at(self, value: str) -> None:
+        self._updated_at = value
+        self._dirty = False
         
     def add_node(self, node: Node) -> None:
         """
@@ -62,40 +141,75 @@ class Workflow:
         Raises:
             WorkflowError: If node is not a Node instance or if a node with the same ID already exists
         """
-        if not isinstance(node, Node):
-            error_msg = f"Expected Node instance, got {type(node).__name__}"
-            logger.error(f"Failed to add node to workflow '{self.name}': {error_msg}")
-            raise WorkflowError(error_msg, ErrorCodes.NODE_INVALID_TYPE)
+        self._check_node_type(node)
         
         # Check if node with same ID already exists
-        if any(existing_node.id == node.id for existing_node in self.nodes):
-            error_msg = f"Node with ID '{node.id}' already exists in workflow"
-            logger.error(f"Failed to add node to workflow '{self.name}': {error_msg}")
-            raise WorkflowError(error_msg, ErrorCodes.WORKFLOW_DUPLICATE_NODE)
-        
-        # Check if node with same name already exists
-        if any(existing_node.name == node.name for existing_node in self.nodes):
-            error_msg = f"Node with name '{node.name}' already exists in workflow"
-            logger.warning(f"Adding node to workflow '{self.name}': {error_msg}")
+        if node.id in self._nodes_by_id:
+            self._raise_duplicate_id(node.id)
         
         self.nodes.append(node)
-        self.updated_at = datetime.now().isoformat()
+        self._nodes_by_id[node.id] = node
+        self._index_node_name(node)
+        self._dirty = True
         
-        logger.debug(f"Added node '{node.name}' (ID: {node.id}, Type: {node.type}) to workflow '{self.name}'")
+        logger.debug("Added node '%s' (ID: %s, Type: %s) to workflow '%s'", node.name, node.id, node.type, self.name)
         
     def add_nodes(self, *nodes: Node) -> None:
         """
         Add multiple nodes to the workflow.
         
+        The whole batch is checked before anything is added, so if any node
+        is rejected the workflow is left unchanged.
+        
         Args:
             *nodes: Variable number of nodes to add to the workflow
             
         Raises:
-            TypeError: If any node is not a Node instance
-            ValueError: If any node ID already exists
+            WorkflowError: If any node is not a Node instance, or if a node ID
+                already exists in the workflow or appears twice in the batch
         """
+        if not nodes:
+            return
+        for node in nodes:
+            self._check_node_type(node)
+        
+        # One set operation covers clashes with existing nodes and within the batch
+        incoming_ids = {node.id for node in nodes}
+        if len(incoming_ids) != len(nodes) or not incoming_ids.isdisjoint(self._nodes_by_id):
+            seen = set()
+            for node in nodes:
+                if node.id in seen or node.id in self._nodes_by_id:
+                    self._raise_duplicate_id(node.id)
+                seen.add(node.id)
+        
+        self.nodes.extend(nodes)
+        self._nodes_by_id.update((node.id, node) for node in nodes)
         for node in nodes:
-            self.add_node(node)
+            self._index_node_name(node)
+        self._dirty = True
+        
+        logger.debug("Added %d nodes to workflow '%s'", len(nodes), self.name)
+    
+    def _check_node_type(self, node: Any) -> None:
+        """Raise WorkflowError unless ``node`` is a Node instance."""
+        if not isinstance(node, Node):
+            error_msg = f"Expected Node instance, got {type(node).__name__}"
+            logger.error(f"Failed to add node to workflow '{self.name}': {error_msg}")
+            raise WorkflowError(error_msg, ErrorCodes.NODE_INVALID_TYPE)
+    
+    def _raise_duplicate_id(self, node_id: str) -> None:
+        """Raise WorkflowError for a node ID that is already taken."""
+        error_msg = f"Node with ID '{node_id}' already exists in workflow"
+        logger.error(f"Failed to add node to workflow '{self.name}': {error_msg}")
+        raise WorkflowError(error_msg, ErrorCodes.WORKFLOW_DUPLICATE_NODE)
+    
+    def _index_node_name(self, node: Node) -> None:
+        """Index a newly added node by name, warning if the name is already used."""
+        if node.name in self._nodes_by_name:
+            error_msg = f"Node with name '{node.name}' already exists in workflow"
+            logger.warning(f"Adding node to workflow '{self.name}': {error_msg}")
+        else:
+            self._nodes_by_name[node.name] = node
         
     def connect(
         self, 
@@ -120,47 +234,43 @@ class Workflow:
         Raises:
             WorkflowError: If either node is not in the workflow
         """
-        # Verify both nodes are in the workflow
-        if from_node not in self.nodes:
+        # Verify both nodes are in the workflow: the node indexed under the ID must be
+        # this very object, so an equal-ID copy of a workflow node is not accepted
+        if self._nodes_by_id.get(from_node.id) is not from_node:
             error_msg = f"Source node '{from_node.name}' is not in the workflow"
             logger.error(f"Failed to create connection in workflow '{self.name}': {error_msg}")
             raise WorkflowError(error_msg, ErrorCodes.CONNECTION_SOURCE_NOT_FOUND)
-        if to_node not in self.nodes:
+        if self._nodes_by_id.get(to_node.id) is not to_node:
             error_msg = f"Target node '{to_node.name}' is not in the workflow"
             logger.error(f"Failed to create connection in workflow '{self.name}': {error_msg}")
             raise WorkflowError(error_msg, ErrorCodes.CONNECTION_TARGET_NOT_FOUND)
         
-        # Initialize connection structure using node names (as n8n uses names for connections)
         source_name = from_node.name
-        if source_name not in self.connections:
-            self.connections[source_name] = {}
+        target_name = to_node.name
         
-        if output_type not in self.connections[source_name]:
-            self.connections[source_name][output_type] = []
+        # Connections are keyed by node names (as n8n uses names for connections)
+        connections = self.connections
+        output_groups = connections.setdefault(source_name, {}).setdefault(output_type, [])
         
-        # Ensure we have enough output slots
-        while len(self.connections[source_name][output_type]) <= output_index:
-            self.connections[source_name][output_type].append([])
+        # Ensure we have enough output slots, growing the list in one step
+        if len(output_groups) <= output_index:
+            output_groups.extend([] for _ in range(output_index + 1 - len(output_groups)))
         
         # Create the connection
-        connection = {
-            "node": to_node.name,
+        output_groups[output_index].append({
+            "node": target_name,
             "type": input_type,
             "index": input_index
-        }
-        
-        self.connections[source_name][output_type][output_index].append(connection)
-        self.updated_at = datetime.now().isoformat()
+        })
         
         # Ensure target node has empty connection placeholder if it doesn't exist
-        target_name = to_node.name
-        if target_name not in self.connections:
-            self.connections[target_name] = {
-                "main": [[]]
-            }
+        if target_name not in connections:
+            connections[target_name] = {"main": [[]]}
+        
+        self._dirty = True
         
-        logger.debug(f"Connected '{from_node.name}' to '{to_node.name}' in workflow '{self.name}' "
-                    f"(output: {output_type}[{output_index}] -> input: {input_type}[{input_index}])")
+        logger.debug("Connected '%s' to '%s' in workflow '%s' (output: %s[%s] -> input: %s[%s])",
+                     source_name, target_name, self.name, output_type, output_index, input_type, input_index)
         
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -169,10 +279,15 @@ class Workflow:
         Returns:
             Dictionary representation of the workflow
         """
+        # Node.to_dict() reuses its cached fields; only changed nodes are rebuilt
+        return self._dict_with_nodes([node.to_dict() for node in self.nodes])
+    
+    def _dict_with_nodes(self, node_dicts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Assemble the to_dict() output around already-built node dictionaries."""
         return {
             "id": self.id,
             "name": self.name,
-            "nodes": [node.to_dict() for node in self.nodes],
+            "nodes": node_dicts,
             "connections": self.connections,
             "active": self.active,
             "settings": self.settings,
@@ -185,6 +300,22 @@ class Workflow:
             }
         }
         
+    def to_json_bytes(self, pretty: bool = False) -> bytes:
+        """
+        Serialize the workflow to UTF-8 encoded JSON without writing a file.
+        
+        Uses orjson when it is installed and the stdlib ``json`` module
+        otherwise. No validation is performed; call ``validate()`` first if
+        needed.
+        
+        Args:
+            pretty: Whether to indent the JSON by two spaces
+            
+        Returns:
+            The JSON document for ``to_dict()``
+        """
+        return dump_json_bytes(self.to_dict(), pretty)
+        
     def export(self, file_path: str, pretty: bool = True, validate: bool = True) -> None:
         """
         Export workflow to JSON file compatible with n8n.
@@ -198,40 +329,44 @@ class Workflow:
             ExportError: If the file cannot be written or JSON serialization fails
             ValidationError: If validation fails and validate=True
         """
-        logger.info(f"Starting export of workflow '{self.name}' to {file_path}")
+        logger.info("Starting export of workflow '%s' to %s", self.name, file_path)
         
         try:
             # Create directory if it doesn't exist
-            dir_path = os.path.dirname(os.path.abspath(file_path))
+            dir_path = os.path.dirname(file_path)
             if dir_path:
                 os.makedirs(dir_path, exist_ok=True)
-                logger.debug(f"Created directory: {dir_path}")
+                logger.debug("Created directory: %s", dir_path)
             
             # Validate workflow if requested
             if validate:
-                logger.debug(f"Validating workflow '{self.name}' before export")
-                validation_errors = self.validate()
+                logger.debug("Validating workflow '%s' before export", self.name)
+                workflow_dict, validation_errors = self._build_dict_validating()
                 if validation_errors:
                     error_msg = f"Workflow validation failed: {', '.join(validation_errors)}"
                     logger.error(f"Export failed for workflow '{self.name}': {error_msg}")
                     raise ValidationError(error_msg, ErrorCodes.EXPORT_VALIDATION_ERROR)
-                logger.debug(f"Workflow '{self.name}' validation passed")
+                logger.debug("Workflow '%s' validation passed", self.name)
+            else:
+                # Convert workflow to dictionary
+                workflow_dict = self.to_dict()
+            logger.debug("Converted workflow '%s' to dictionary format", self.name)
             
-            # Convert workflow to dictionary
-            workflow_dict = self.to_dict()
-            logger.debug(f"Converted workflow '{self.name}' to dictionary format")
-            
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                if pretty:
-                    json.dump(workflow_dict, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(workflow_dict, f, ensure_ascii=False)
+            # Encode the whole document first (json.dumps can use the C encoder, json.dump
+            # never does), then write it through a large buffer in as few syscalls as possible.
+            # Very large workflows are encoded node by node to bound peak memory instead.
+            if len(workflow_dict["nodes"]) > STREAMING_EXPORT_THRESHOLD:
+                chunks = _iter_json_chunks(workflow_dict, pretty)
+            else:
+                chunks = (dump_json_bytes(workflow_dict, pretty),)
+            with open(file_path, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                for chunk in chunks:
+                    f.write(chunk)
             
             # Update timestamp
             self.updated_at = datetime.now().isoformat()
             
-            logger.info(f"Successfully exported workflow '{self.name}' to {file_path}")
+            logger.info("Successfully exported workflow '%s' to %s", self.name, file_path)
             
         except IOError as e:
             error_msg = f"Failed to export workflow to {file_path}: {str(e)}"
@@ -246,10 +381,42 @@ class Workflow:
             logger.error(f"Unexpected error during export of workflow '{self.name}': {error_msg}")
             raise ExportError(error_msg)
     
-    def validate(self) -> List[str]:
+    def validate(self, check_cycles: bool = False) -> List[str]:
         """
         Validate the workflow and return list of validation errors.
         
+        Args:
+            check_cycles: Also report loops in the connections. n8n allows
+                loops (for example a Loop Over Items node feeding back into
+                itself), so they are not errors unless asked for.
+        
+        Returns:
+            List of validation error messages. Empty list if valid.
+        """
+        return self._collect_errors([node.validate() for node in self.nodes], check_cycles)
+    
+    def _build_dict_validating(self) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Build the to_dict() output and the validate() errors in one walk over the nodes.
+        
+        Returns:
+            Tuple of (workflow dictionary, validation error messages)
+        """
+        node_dicts = []
+        node_errors = []
+        for node in self.nodes:
+            node_errors.append(node.validate())
+            node_dicts.append(node.to_dict())
+        return self._dict_with_nodes(node_dicts), self._collect_errors(node_errors)
+    
+    def _collect_errors(self, node_errors: List[List[str]], check_cycles: bool = False) -> List[str]:
+        """
+        Run the workflow-level checks for validate().
+        
+        Args:
+            node_errors: Validation errors of each node, in node order
+            check_cycles: Whether to report loops in the connections
+            
         Returns:
             List of validation error messages. Empty list if valid.
         """
@@ -263,37 +430,123 @@ class Workflow:
         if not self.nodes:
             errors.append("Workflow must contain at least one node")
         
-        # Check for duplicate node IDs
-        node_ids = [node.id for node in self.nodes]
-        if len(node_ids) != len(set(node_ids)):
-            errors.append("Duplicate node IDs found")
+        # Check for duplicate node IDs and names. While an index still describes
+        # self.nodes exactly there can be no duplicates; after direct edits to the
+        # node list or to node IDs/names, fall back to a full scan.
+        if not self._index_matches_nodes(self._nodes_by_id, 'id'):
+            if len({node.id for node in self.nodes}) != len(self.nodes):
+                errors.append("Duplicate node IDs found")
         
-        # Check for duplicate node names
-        node_names = [node.name for node in self.nodes]
-        if len(node_names) != len(set(node_names)):
-            errors.append("Duplicate node names found")
+        if self._index_matches_nodes(self._nodes_by_name, 'name'):
+            node_names_set = self._nodes_by_name.keys()
+        else:
+            node_names_set = {node.name for node in self.nodes}
+            if len(node_names_set) != len(self.nodes):
+                errors.append("Duplicate node names found")
         
         # Validate each node
-        for i, node in enumerate(self.nodes):
-            node_errors = node.validate()
-            for error in node_errors:
+        for i, (node, errors_of_node) in enumerate(zip(self.nodes, node_errors)):
+            for error in errors_of_node:
                 errors.append(f"Node {i+1} ({node.name}): {error}")
         
-        # Validate connections
-        node_names_set = {node.name for node in self.nodes}
-        for source_name, outputs in self.connections.items():
+        # Validate connections, collecting the adjacency list for cycle detection
+        adjacency: Dict[str, List[str]] = {}
+        for source_name, target_names in self._iter_connection_targets():
             if source_name not in node_names_set:
                 errors.append(f"Connection source '{source_name}' does not exist")
+            successors = adjacency.setdefault(source_name, [])
             
-            for output_type, output_groups in outputs.items():
-                for output_group in output_groups:
-                    for connection in output_group:
-                        if isinstance(connection, dict) and 'node' in connection:
-                            target_name = connection['node']
-                            if target_name not in node_names_set:
-                                errors.append(f"Connection target '{target_name}' does not exist")
+            for target_name in target_names:
+                if target_name not in node_names_set:
+                    errors.append(f"Connection target '{target_name}' does not exist")
+                else:
+                    successors.append(target_name)
+        
+        # Check for circular dependencies, if asked to
+        if check_cycles:
+            cyclic_nodes = self._find_cyclic_nodes(node_names_set, adjacency)
+            if cyclic_nodes:
+                errors.append(f"Circular dependency detected involving nodes: {', '.join(cyclic_nodes)}")
         
         return errors
+    
+    def _index_matches_nodes(self, index: Dict[str, Node], attribute: str) -> bool:
+        """
+        Check that a node index maps every node's current ``attribute`` to that node.
+        
+        This holds exactly when the index is in sync with self.nodes and the
+        attribute values are unique, and costs one dict lookup per node.
+        """
+        return len(index) == len(self.nodes) and all(
+            index.get(getattr(node, attribute)) is node for node in self.nodes
+        )
+    
+    def validate_dag(self) -> bool:
+        """
+        Check that the connections contain no circular dependency.
+        
+        n8n allows loops, so connect() and validate() accept them by default;
+        call this when a workflow must be acyclic. The connections are checked
+        as they currently are, including edits made to them in place.
+        
+        Returns:
+            True if the connection graph is acyclic
+        """
+        node_names = {node.name for node in self.nodes}
+        adjacency: Dict[str, List[str]] = {}
+        for source_name, target_names in self._iter_connection_targets():
+            node_names.add(source_name)
+            node_names.update(target_names)
+            adjacency.setdefault(source_name, []).extend(target_names)
+        return not self._find_cyclic_nodes(node_names, adjacency)
+    
+    @staticmethod
+    def _topological_order(node_names: Set[str], adjacency: Dict[str, Any]) -> List[str]:
+        """
+        Run Kahn's topological sort over the connection graph.
+        
+        Args:
+            node_names: Names of all nodes in the graph
+            adjacency: Mapping of source node name to its target node names
+            
+        Returns:
+            The node names that could be ordered, in topological order. Nodes
+            that are part of (or downstream of) a cycle are left out.
+        """
+        in_degree = dict.fromkeys(node_names, 0)
+        for source_name, targets in adjacency.items():
+            if source_name in in_degree:
+                for target_name in targets:
+                    in_degree[target_name] += 1
+        
+        ready = deque(name for name, degree in in_degree.items() if degree == 0)
+        ordered = []
+        while ready:
+            name = ready.popleft()
+            ordered.append(name)
+            for target_name in adjacency.get(name, ()):
+                in_degree[target_name] -= 1
+                if in_degree[target_name] == 0:
+                    ready.append(target_name)
+        return ordered
+    
+    @classmethod
+    def _find_cyclic_nodes(cls, node_names: Set[str], adjacency: Dict[str, List[str]]) -> List[str]:
+        """
+        Find the nodes that keep the connection graph from being acyclic.
+        
+        Args:
+            node_names: Names of all nodes in the workflow
+            adjacency: Mapping of source node name to its target node names
+            
+        Returns:
+            Names of the nodes that could not be ordered because they are part
+            of (or downstream of) a cycle. Empty list if the graph is acyclic.
+        """
+        ordered = cls._topological_order(node_names, adjacency)
+        if len(ordered) == len(node_names):
+            return []
+        return sorted(set(node_names).difference(ordered))
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Workflow':
@@ -327,6 +580,8 @@ class Workflow:
         for node_data in nodes_data:
             node = Node.from_dict(node_data)
             workflow.nodes.append(node)
+            workflow._nodes_by_id[node.id] = node
+            workflow._nodes_by_name.setdefault(node.name, node)
         
         # Import connections
         workflow.connections = data.get("connections", {})
@@ -350,8 +605,9 @@ class Workflow:
             ValueError: If the workflow data is invalid
         """
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Large files are memory-mapped rather than read into memory when orjson is available
+            with open(filename, 'rb') as f:
+                data = load_json_file_object(f, os.fstat(f.fileno()).st_size)
             return cls.from_dict(data)
         except FileNotFoundError:
             raise FileNotFoundError(f"Workflow file not found: {filename}")
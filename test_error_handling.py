@@ -8,6 +8,9 @@ to ensure they work correctly with the SDK.
 
 import sys
 import os
+import json
+import shutil
+import tempfile
 
 # Add the current directory to Python path to enable imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -15,8 +18,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from n8n_python_sdk.workflow import Workflow
 from n8n_python_sdk.node import Node
 from n8n_python_sdk.nodes.manual_trigger import ManualTriggerNode
+from n8n_python_sdk.nodes.google_sheets import GoogleSheetsNode
 from n8n_python_sdk.exceptions import WorkflowError, NodeError, ValidationError, ExportError
 from n8n_python_sdk.logging_config import configure_logging, enable_debug_logging
+from n8n_python_sdk.utils.json_parser import process_workflow_directory
 import logging
 
 
@@ -102,6 +107,168 @@ def test_node_error_handling():
     return True
 
 
+def test_node_serialization():
+    """Test that Node.to_dict() results can be modified without affecting the node."""
+    print("🧪 Testing node serialization...")
+    
+    node = ManualTriggerNode(name="Trigger")
+    
+    # Modifying one result must not leak into later ones
+    node_dict = node.to_dict()
+    node_dict["name"] = "Changed"
+    if node.to_dict()["name"] != "Trigger":
+        print("❌ Modifying a to_dict() result should not change later results")
+        return False
+    print("✅ to_dict() returns an independent dictionary")
+    
+    # Credentials filled in place after a first serialization must still be emitted
+    credentials = {"httpBasicAuth": {"id": "1", "name": "Basic Auth"}}
+    node.credentials.update(credentials)
+    if node.to_dict().get("credentials") != credentials:
+        print("❌ Credentials added in place should be serialized")
+        return False
+    print("✅ Credentials added in place are serialized")
+    
+    print("✅ Node serialization tests passed")
+    return True
+
+
+def test_node_ids():
+    """Test that generated node IDs do not depend on the global random state."""
+    print("🧪 Testing node ID generation...")
+    
+    import random
+    random.seed(42)
+    first_id = ManualTriggerNode(name="Trigger").id
+    random.seed(42)
+    second_id = ManualTriggerNode(name="Trigger").id
+    if first_id == second_id:
+        print("❌ Seeding the random module should not repeat node IDs")
+        return False
+    print("✅ Node IDs are independent of random.seed()")
+    
+    print("✅ Node ID generation tests passed")
+    return True
+
+
+def test_google_sheets_columns():
+    """Test building Google Sheets column configurations from column names."""
+    print("🧪 Testing Google Sheets column configuration...")
+    
+    first = GoogleSheetsNode.append_or_update(columns=["name", "email"], matching_columns=["email"])
+    second = GoogleSheetsNode.append_or_update(columns=["name", "email"], matching_columns=["email"])
+    first_columns = first.parameters["columns"]
+    if [entry["id"] for entry in first_columns["schema"]] != ["name", "email"]:
+        print(f"❌ Schema should list the given columns in order: {first_columns['schema']}")
+        return False
+    
+    # Each node gets its own configuration
+    first_columns["schema"][0]["display"] = False
+    first_columns["value"]["name"] = "changed"
+    second_columns = second.parameters["columns"]
+    if second_columns["schema"][0]["display"] is not True or second_columns["value"]["name"] == "changed":
+        print("❌ Nodes built from the same column names should not share their configuration")
+        return False
+    print("✅ Column configurations are built per node")
+    
+    # An empty list behaves like no columns at all
+    empty = GoogleSheetsNode.append_or_update(columns=[])
+    if empty.parameters["columns"] != {"mappingMode": "defineBelow"}:
+        print(f"❌ An empty column list should give the default mapping mode: {empty.parameters['columns']}")
+        return False
+    print("✅ An empty column list is treated like no columns")
+    
+    print("✅ Google Sheets column configuration tests passed")
+    return True
+
+
+def test_workflow_cycle_checks():
+    """Test that loops are accepted by default and reported on request."""
+    print("🧪 Testing workflow cycle checks...")
+    
+    workflow = Workflow("Loop Workflow")
+    first = ManualTriggerNode(name="First")
+    second = ManualTriggerNode(name="Second")
+    workflow.add_nodes(first, second)
+    workflow.connect(first, second)
+    workflow.connect(second, first)
+    
+    # n8n allows loops, so they are not validation errors by default
+    errors = workflow.validate()
+    if errors:
+        print(f"❌ A loop should not be a validation error by default: {errors}")
+        return False
+    print("✅ Loops are accepted by default")
+    
+    errors = workflow.validate(check_cycles=True)
+    if not any("Circular dependency" in error for error in errors):
+        print(f"❌ validate(check_cycles=True) should report the loop: {errors}")
+        return False
+    print("✅ validate(check_cycles=True) reports loops")
+    
+    if workflow.validate_dag():
+        print("❌ validate_dag() should reject a loop")
+        return False
+    
+    acyclic = Workflow("Acyclic Workflow")
+    start = ManualTriggerNode(name="Start")
+    end = ManualTriggerNode(name="End")
+    acyclic.add_nodes(start, end)
+    acyclic.connect(start, end)
+    if not acyclic.validate_dag():
+        print("❌ validate_dag() should accept an acyclic workflow")
+        return False
+    print("✅ validate_dag() tells loops from acyclic workflows")
+    
+    print("✅ Workflow cycle check tests passed")
+    return True
+
+
+def test_json_serialization():
+    """Test encoding nodes and workflows as JSON bytes."""
+    print("🧪 Testing JSON serialization...")
+    
+    workflow = Workflow("JSON Workflow")
+    trigger = ManualTriggerNode(name="Trigger")
+    sheets = GoogleSheetsNode.append_or_update(name="Sheets", columns=["name", "email"])
+    workflow.add_nodes(trigger, sheets)
+    workflow.connect(trigger, sheets)
+    
+    if json.loads(trigger.to_json_bytes()) != trigger.to_dict():
+        print("❌ Node.to_json_bytes() should encode to_dict()")
+        return False
+    for pretty in (False, True):
+        encoded = workflow.to_json_bytes(pretty)
+        if json.loads(encoded) != workflow.to_dict():
+            print(f"❌ Workflow.to_json_bytes(pretty={pretty}) should encode to_dict()")
+            return False
+        if encoded.startswith(b'{\n  "') != pretty:
+            print(f"❌ Workflow.to_json_bytes(pretty={pretty}) has the wrong indentation")
+            return False
+    print("✅ to_json_bytes() encodes to_dict()")
+    
+    # Streamed exports must be byte-for-byte equal to the one-shot encoding
+    import n8n_python_sdk.workflow as workflow_module
+    threshold = workflow_module.STREAMING_EXPORT_THRESHOLD
+    workflow_module.STREAMING_EXPORT_THRESHOLD = 0
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "streamed.json")
+            for pretty in (False, True):
+                expected = workflow.to_json_bytes(pretty)
+                workflow.export(file_path, pretty=pretty)
+                with open(file_path, "rb") as f:
+                    if f.read() != expected:
+                        print(f"❌ Streamed export (pretty={pretty}) differs from to_json_bytes()")
+                        return False
+    finally:
+        workflow_module.STREAMING_EXPORT_THRESHOLD = threshold
+    print("✅ Streamed exports match to_json_bytes()")
+    
+    print("✅ JSON serialization tests passed")
+    return True
+
+
 def test_export_error_handling():
     """Test export error handling."""
     print("🧪 Testing export error handling...")
@@ -130,6 +297,40 @@ def test_export_error_handling():
     return True
 
 
+def test_workflow_directory_processing():
+    """Test reading workflow files from a directory."""
+    print("🧪 Testing workflow directory processing...")
+    
+    sample_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "n8n", "n8n-sample-workflows", "workflow001.json"
+    )
+    
+    with tempfile.TemporaryDirectory() as directory:
+        os.mkdir(os.path.join(directory, "sub"))
+        shutil.copy(sample_path, os.path.join(directory, "sub", "valid.json"))
+        
+        # Patterns may contain directory parts
+        for pattern in ("sub/*.json", "**/*.json"):
+            workflows = process_workflow_directory(directory, pattern=pattern)
+            if list(workflows) != ["valid.json"]:
+                print(f"❌ Pattern '{pattern}' should match sub/valid.json, got {list(workflows)}")
+                return False
+        print("✅ Patterns with directory parts are matched")
+        
+        # Files that fail to parse are reported through the errors dictionary
+        with open(os.path.join(directory, "broken.json"), "w") as f:
+            f.write("{")
+        errors = {}
+        workflows = process_workflow_directory(directory, recursive=True, max_workers=1, errors=errors)
+        if list(workflows) != ["valid.json"] or list(errors) != ["broken.json"]:
+            print(f"❌ Expected valid.json to load and broken.json to fail, got {list(workflows)} and {list(errors)}")
+            return False
+        print("✅ Failed files are reported through the errors dictionary")
+    
+    print("✅ Workflow directory processing tests passed")
+    return True
+
+
 def test_successful_workflow_creation():
     """Test successful workflow creation with logging."""
     print("🧪 Testing successful workflow creation...")
@@ -170,10 +371,34 @@ def main():
             all_tests_passed = False
         print()
         
+        if not test_node_serialization():
+            all_tests_passed = False
+        print()
+        
+        if not test_node_ids():
+            all_tests_passed = False
+        print()
+        
+        if not test_google_sheets_columns():
+            all_tests_passed = False
+        print()
+        
+        if not test_workflow_cycle_checks():
+            all_tests_passed = False
+        print()
+        
+        if not test_json_serialization():
+            all_tests_passed = False
+        print()
+        
         if not test_export_error_handling():
             all_tests_passed = False
         print()
         
+        if not test_workflow_directory_processing():
+            all_tests_passed = False
+        print()
+        
         if not test_successful_workflow_creation():
             all_tests_passed = False
         print()
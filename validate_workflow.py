@@ -8,15 +8,103 @@ and testing various node configurations to ensure flexibility.
 
 import sys
 import os
-import json
+import io
+import functools
+import importlib
+import contextlib
 
-# Add the current directory to Python path to enable imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add this script's directory to Python path to enable imports; __file__ is
+# already absolute for scripts on Python 3.9+, so no abspath() is needed
+_HERE = os.path.dirname(__file__) or '.'
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
 
-from n8n_python_sdk.workflow import Workflow
-from n8n_python_sdk.nodes.manual_trigger import ManualTriggerNode
-from n8n_python_sdk.nodes.http_request import HTTPRequestNode
-from n8n_python_sdk.nodes.google_sheets import GoogleSheetsNode
+# SDK classes are imported where they are used, so importing this module (or
+# running only compare_workflows) does not load the SDK. They remain available
+# as module attributes through __getattr__ below.
+_LAZY_IMPORTS = {
+    "Workflow": "n8n_python_sdk.workflow",
+    "ManualTriggerNode": "n8n_python_sdk.nodes.manual_trigger",
+    "HTTPRequestNode": "n8n_python_sdk.nodes.http_request",
+    "GoogleSheetsNode": "n8n_python_sdk.nodes.google_sheets",
+}
+
+# Workflow files compared by compare_workflows()
+GENERATED_WORKFLOW_PATH = "n8n-workflows/workflow.json"
+ORIGINAL_WORKFLOW_PATH = "n8n/n8n-sample-workflows/workflow001.json"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path, mtime_ns):
+    """Parse a JSON file; cached per modification time so unchanged files are parsed once."""
+    # The SDK's loader uses orjson when it is installed
+    from n8n_python_sdk.utils.json_io import load_json_file_object
+    
+    with open(path, "rb") as f:
+        data = load_json_file_object(f, os.fstat(f.fileno()).st_size)
+    # Node types repeat across workflows; interned, equal types compare by identity
+    if isinstance(data, dict):
+        for node in data.get("nodes", ()):
+            node_type = node.get("type") if isinstance(node, dict) else None
+            if isinstance(node_type, str):
+                node["type"] = sys.intern(node_type)
+    return data
+
+
+def load_json(path):
+    """Load a JSON file through the cache. The result is shared, so do not modify it."""
+    return _load_json(path, os.stat(path).st_mtime_ns)
+
+
+# Checks run by compare_workflows(): (label, path into the workflow JSON, optional transform)
+STRUCTURE_CHECKS = (
+    ("Number of nodes", ("nodes",), len),
+    ("Manual trigger node type", ("nodes", 0, "type"), None),
+    ("HTTP request node type", ("nodes", 1, "type"), None),
+    ("Google Sheets node type", ("nodes", 2, "type"), None),
+    ("Number of connections", ("connections",), len),
+)
+PARAMETER_CHECKS = (
+    ("HTTP Request URL", ("nodes", 1, "parameters", "url"), None),
+    ("Google Sheets operation", ("nodes", 2, "parameters", "operation"), None),
+)
+
+
+def _get(data, path):
+    """Follow a tuple of keys and indexes into parsed JSON."""
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _run_checks(checks, generated, original):
+    """Compare the generated and original workflow at each check's path and report the results."""
+    all_passed = True
+    report = []
+    emit = report.append
+    for check_name, path, transform in checks:
+        generated_value = _get(generated, path)
+        original_value = _get(original, path)
+        if transform is not None:
+            generated_value = transform(generated_value)
+            original_value = transform(original_value)
+        if generated_value == original_value:
+            emit(f"✅ {check_name}: Match ({generated_value})")
+        else:
+            emit(f"❌ {check_name}: Mismatch (generated: {generated_value}, original: {original_value})")
+            all_passed = False
+    print("\n".join(report))
+    return all_passed
+
+
+def __getattr__(name):
+    """Resolve the lazily imported SDK classes and cache them on the module."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 def compare_workflows():
@@ -25,56 +113,24 @@ def compare_workflows():
     
     # Load the generated workflow
     try:
-        with open("n8n-workflows/workflow.json", "r") as f:
-            generated = json.load(f)
+        generated = load_json(GENERATED_WORKFLOW_PATH)
     except FileNotFoundError:
         print("❌ Generated workflow file not found!")
         return False
     
     # Load the original workflow
     try:
-        with open("n8n/n8n-sample-workflows/workflow001.json", "r") as f:
-            original = json.load(f)
+        original = load_json(ORIGINAL_WORKFLOW_PATH)
     except FileNotFoundError:
         print("❌ Original workflow file not found!")
         return False
     
     # Compare key structures
-    checks = [
-        ("Number of nodes", len(generated["nodes"]), len(original["nodes"])),
-        ("Manual trigger node type", generated["nodes"][0]["type"], original["nodes"][0]["type"]),
-        ("HTTP request node type", generated["nodes"][1]["type"], original["nodes"][1]["type"]),
-        ("Google Sheets node type", generated["nodes"][2]["type"], original["nodes"][2]["type"]),
-        ("Number of connections", len(generated["connections"]), len(original["connections"])),
-    ]
-    
-    all_passed = True
-    for check_name, generated_value, original_value in checks:
-        if generated_value == original_value:
-            print(f"✅ {check_name}: Match ({generated_value})")
-        else:
-            print(f"❌ {check_name}: Mismatch (generated: {generated_value}, original: {original_value})")
-            all_passed = False
+    all_passed = _run_checks(STRUCTURE_CHECKS, generated, original)
     
     # Check node parameters
     print("\n🔍 Checking node parameters...")
-    
-    # HTTP Request URL
-    gen_url = generated["nodes"][1]["parameters"]["url"]
-    orig_url = original["nodes"][1]["parameters"]["url"]
-    if gen_url == orig_url:
-        print(f"✅ HTTP Request URL: Match ({gen_url})")
-    else:
-        print(f"❌ HTTP Request URL: Mismatch")
-        all_passed = False
-    
-    # Google Sheets operation
-    gen_op = generated["nodes"][2]["parameters"]["operation"]
-    orig_op = original["nodes"][2]["parameters"]["operation"]
-    if gen_op == orig_op:
-        print(f"✅ Google Sheets operation: Match ({gen_op})")
-    else:
-        print(f"❌ Google Sheets operation: Mismatch")
+    if not _run_checks(PARAMETER_CHECKS, generated, original):
         all_passed = False
     
     return all_passed
@@ -84,6 +140,11 @@ def test_node_configurations():
     """Test different node configurations to ensure flexibility."""
     print("\n🧪 Testing node configuration flexibility...")
     
+    from n8n_python_sdk.workflow import Workflow
+    from n8n_python_sdk.nodes.manual_trigger import ManualTriggerNode
+    from n8n_python_sdk.nodes.http_request import HTTPRequestNode
+    from n8n_python_sdk.nodes.google_sheets import GoogleSheetsNode
+    
     tests_passed = 0
     total_tests = 0
     
@@ -136,15 +197,26 @@ def test_node_configurations():
     return tests_passed == total_tests
 
 
+def _run_buffered(test_func):
+    """Run a test group with its output collected and written to stdout in one call."""
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return test_func()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 def main():
     """Main validation function."""
     print("🚀 Starting workflow validation...\n")
     
     # Test 1: Compare with PRD example
-    comparison_passed = compare_workflows()
+    comparison_passed = _run_buffered(compare_workflows)
     
     # Test 2: Test node configurations
-    config_tests_passed = test_node_configurations()
+    config_tests_passed = _run_buffered(test_node_configurations)
     
     # Final results
     print("\n" + "="*50)